@@ -1,20 +1,164 @@
-import boto3
 import os
+import random
+from time import monotonic, sleep
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table(os.environ['TABLE_NAME'])
+TABLE_NAME = os.environ['TABLE_NAME']
+
+# Importing boto3 loads botocore's full service data model, a noticeable
+# slice of cold-start time, so the import and client construction are
+# deferred to the first invocation. The client is still cached in a module
+# global, so warm invocations reuse the same urllib3 connection pool
+# instead of paying a new TLS handshake per call.
+_dynamodb = None
+
+def _get_client():
+    """Return the cached DynamoDB (or DAX) client, creating it on first use."""
+    global _dynamodb
+    if _dynamodb is None:
+        # When a DAX cluster endpoint is configured, route reads through it
+        # for ~1ms in-memory cache hits; otherwise fall back to plain
+        # DynamoDB. The DAX client mirrors the low-level get_item interface,
+        # so the calling code is identical either way.
+        dax_endpoint = os.environ.get('DAX_ENDPOINT')
+        if dax_endpoint:
+            import amazondax
+            _dynamodb = amazondax.AmazonDaxClient(endpoint_url=dax_endpoint)
+        else:
+            import boto3
+            from botocore.config import Config
+
+            # Adaptive retries use a client-side token bucket to back off
+            # before throttling hits, and two attempts bound worst-case tail
+            # latency on this latency-critical read path
+            config = Config(
+                tcp_keepalive=True,
+                max_pool_connections=10,
+                retries={'mode': 'adaptive', 'max_attempts': 2}
+            )
+            _dynamodb = boto3.client('dynamodb', config=config)
+    return _dynamodb
+
+# Short-TTL status cache held at module scope so repeated lookups for the
+# same order within a warm container skip the DynamoDB round-trip entirely
+_CACHE = {}
+_CACHE_TTL = 5.0
+_CACHE_MAX_SIZE = 1024
+
+# How many times to re-request keys BatchGetItem left unprocessed before
+# giving up and letting the handler's error path answer
+_BATCH_MAX_ATTEMPTS = 5
+
+def get_order_status(order_id):
+    """Return the order's Status string, or None if the order doesn't exist."""
+    entry = _CACHE.get(order_id)
+    if entry and monotonic() - entry[1] < _CACHE_TTL:
+        return entry[0]
+
+    # Project only the Status attribute and use an eventually consistent
+    # read: half the RCU cost of a strongly consistent read and fewer
+    # bytes on the wire for wide items
+    response = _get_client().get_item(
+        TableName=TABLE_NAME,
+        Key={'OrderId': {'S': order_id}},
+        ProjectionExpression='#s',
+        ExpressionAttributeNames={'#s': 'Status'},
+        ConsistentRead=False
+    )
+    # The schema is known (Status is a string), so read the attribute value
+    # inline rather than going through the generic TypeDeserializer
+    status = response.get('Item', {}).get('Status', {}).get('S')
+
+    if len(_CACHE) >= _CACHE_MAX_SIZE:
+        _CACHE.pop(next(iter(_CACHE)))
+    _CACHE[order_id] = (status, monotonic())
+
+    return status
+
+def get_order_statuses(order_ids):
+    """Return a dict of OrderId -> Status (None for orders that don't exist)."""
+    statuses = {}
+    misses = []
+    for order_id in order_ids:
+        entry = _CACHE.get(order_id)
+        if entry and monotonic() - entry[1] < _CACHE_TTL:
+            statuses[order_id] = entry[0]
+        else:
+            misses.append(order_id)
+
+    # A multi-valued slot can resolve the same order twice ("123 and 123");
+    # DynamoDB rejects duplicate keys in one BatchGetItem, so dedupe while
+    # keeping the order stable
+    misses = list(dict.fromkeys(misses))
+
+    if not misses:
+        return statuses
+
+    if len(misses) == 1:
+        statuses[misses[0]] = get_order_status(misses[0])
+        return statuses
+
+    # One BatchGetItem instead of N GetItems amortizes the HTTP round-trip
+    # and request signing across all the orders asked about in one turn.
+    # BatchGetItem may return some keys unprocessed (throttling, size
+    # limits), so keep requesting until every key has an answer; otherwise
+    # an unprocessed order would be miscached and reported as not found.
+    found = {}
+    request_items = {
+        TABLE_NAME: {
+            'Keys': [{'OrderId': {'S': order_id}} for order_id in misses],
+            'ProjectionExpression': 'OrderId,#s',
+            'ExpressionAttributeNames': {'#s': 'Status'},
+            'ConsistentRead': False
+        }
+    }
+    delay = 0.1
+    for attempt in range(_BATCH_MAX_ATTEMPTS):
+        if attempt:
+            # Unprocessed keys mean the table is throttling; back off with
+            # jitter before retrying instead of hammering it harder
+            sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * 2, 1.0)
+        response = _get_client().batch_get_item(RequestItems=request_items)
+        for item in response['Responses'].get(TABLE_NAME, []):
+            found[item['OrderId']['S']] = item['Status']['S']
+        request_items = response.get('UnprocessedKeys')
+        if not request_items:
+            break
+    else:
+        raise RuntimeError(
+            f'BatchGetItem left keys unprocessed after {_BATCH_MAX_ATTEMPTS} attempts'
+        )
+
+    for order_id in misses:
+        status = found.get(order_id)
+        if len(_CACHE) >= _CACHE_MAX_SIZE:
+            _CACHE.pop(next(iter(_CACHE)))
+        _CACHE[order_id] = (status, monotonic())
+        statuses[order_id] = status
+
+    return statuses
+
+def extract_order_ids(event):
+    """Pull the OrderId slot as a list, handling both scalar and multi-valued forms."""
+    slot = event['sessionState']['intent']['slots']['OrderId']
+    if 'values' in slot:
+        return [value['value']['interpretedValue'] for value in slot['values']]
+    return [slot['value']['interpretedValue']]
 
 def lambda_handler(event, context):
-    order_id = event['sessionState']['intent']['slots']['OrderId']['value']['interpretedValue']
+    order_ids = extract_order_ids(event)
 
     try:
-        response = table.get_item(Key={'OrderId': order_id})
-        item = response.get('Item')
+        statuses = get_order_statuses(order_ids)
 
-        if item:
-            message = f"Order {order_id} is currently: {item['Status']}"
-        else:
-            message = f"Sorry, I couldn't find order {order_id}"
+        parts = []
+        for order_id in order_ids:
+            status = statuses.get(order_id)
+            if status:
+                parts.append(f"Order {order_id} is currently: {status}")
+            else:
+                parts.append(f"Sorry, I couldn't find order {order_id}")
+        message = ' '.join(parts)
 
         return {
             "sessionState": {
@@ -4,32 +4,84 @@ This script creates a new bot version and updates an alias to point to it.
 '''
 
 import boto3
-import time
-from botocore.exceptions import ClientError
+import botocore.waiter
+from botocore.config import Config
+from botocore.exceptions import ClientError, WaiterError
 
 # Configuration - Update these values for your bot
 BOT_ID = 'YOUR_BOT_ID'
 REGION = 'us-east-1'
 ALIAS_NAME = 'DEMO'
 
+# Keep-alive plus a sized pool so repeated API calls reuse one TLS session
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+)
+
 # Create a boto3 client
 def create_lex_client():
     '''Create Lex v2 client'''
-    return boto3.client('lexv2-models', region_name=REGION)
+    return boto3.client('lexv2-models', region_name=REGION, config=CLIENT_CONFIG)
+
+# Alias IDs never change once created, so memoize lookups and skip the
+# round-trip-bound ListBotAliases call on repeat updates
+_ALIAS_CACHE = {}
 
 # Defining a function that finds out the Alias ID
 def get_alias_id(client, bot_id, alias_name):
     '''Get alias ID from alias name'''
+    cache_key = (bot_id, alias_name)
+    if cache_key in _ALIAS_CACHE:
+        return _ALIAS_CACHE[cache_key]
+
     try:
-        response = client.list_bot_aliases(botId=bot_id)
-        for alias in response['botAliasSummaries']:
-            if alias['botAliasName'] == alias_name:
-                return alias['botAliasId']
+        # Paginate so bots with more than one page of aliases still resolve,
+        # and return as soon as the alias is found without fetching the rest
+        paginator = client.get_paginator('list_bot_aliases')
+        for page in paginator.paginate(botId=bot_id):
+            for alias in page['botAliasSummaries']:
+                if alias['botAliasName'] == alias_name:
+                    _ALIAS_CACHE[cache_key] = alias['botAliasId']
+                    return alias['botAliasId']
         return None
     except ClientError:
         return None
 
-# Defining a function that calls CreateBotVersion 
+# Waiter definition for bot versions; Lex v2 models don't ship one, so we
+# register our own and let botocore drive the describe/backoff loop
+BOT_VERSION_WAITER_CONFIG = {
+    'version': 2,
+    'waiters': {
+        'BotVersionAvailable': {
+            'delay': 2,
+            'maxAttempts': 60,
+            'operation': 'DescribeBotVersion',
+            'acceptors': [
+                {'matcher': 'path', 'argument': 'botStatus', 'expected': 'Available', 'state': 'success'},
+                {'matcher': 'path', 'argument': 'botStatus', 'expected': 'Failed', 'state': 'failure'},
+                {'matcher': 'error', 'expected': 'ResourceNotFoundException', 'state': 'retry'}
+            ]
+        }
+    }
+}
+
+# Defining a function that waits until a new version becomes Available
+def wait_for_bot_version_available(client, bot_id, version):
+    '''Wait for the version to become Available using a custom waiter'''
+    waiter = botocore.waiter.create_waiter_with_client(
+        'BotVersionAvailable',
+        botocore.waiter.WaiterModel(BOT_VERSION_WAITER_CONFIG),
+        client
+    )
+    try:
+        waiter.wait(botId=bot_id, botVersion=version)
+        return True
+    except WaiterError:
+        return False
+
+# Defining a function that calls CreateBotVersion
 def create_bot_version(client, bot_id):
     '''Create new bot version'''
     try:
@@ -42,28 +94,18 @@ def create_bot_version(client, bot_id):
                 }
             }
         )
-        
+
         new_version = response['botVersion']
         print(f'Creating version {new_version}...')
-        
+
         # Wait for version to be ready
-        while True:
-            try:
-                status_response = client.describe_bot_version(
-                    botId=bot_id,
-                    botVersion=new_version
-                )
-                if status_response['botStatus'] == 'Available':
-                    print(f'Version {new_version} ready')
-                    return new_version
-                elif status_response['botStatus'] == 'Failed':
-                    print('Version creation failed')
-                    return None
-                time.sleep(10)
-            except ClientError:
-                time.sleep(10)
-                continue
-                
+        if wait_for_bot_version_available(client, bot_id, new_version):
+            print(f'Version {new_version} ready')
+            return new_version
+
+        print('Version creation failed')
+        return None
+
     except ClientError as e:
         print(f'Error creating version: {e.response["Error"]["Message"]}')
         return None
@@ -71,31 +113,40 @@ def create_bot_version(client, bot_id):
 # This function  calls UpdateBotAlias, provides the bot alias and the new version to attach
 def update_bot_alias(client, bot_id, alias_name, new_version):
     '''Update alias to point to new version'''
-    try:
+    for attempt in range(2):
         alias_id = get_alias_id(client, bot_id, alias_name)
         if not alias_id:
             print(f'Alias {alias_name} not found')
             return False
-        
-        client.update_bot_alias(
-            botAliasId=alias_id,
-            botAliasName=alias_name,
-            botId=bot_id,
-            description=f'Updated to version {new_version}',
-            botVersion=new_version,
-            botAliasLocaleSettings={
-                'en_US': {
-                    'enabled': True
+
+        try:
+            client.update_bot_alias(
+                botAliasId=alias_id,
+                botAliasName=alias_name,
+                botId=bot_id,
+                description=f'Updated to version {new_version}',
+                botVersion=new_version,
+                botAliasLocaleSettings={
+                    'en_US': {
+                        'enabled': True
+                    }
                 }
-            }
-        )
-        
-        print(f'Alias {alias_name} updated to version {new_version}')
-        return True
-        
-    except ClientError as e:
-        print(f'Error updating alias: {e.response["Error"]["Message"]}')
-        return False
+            )
+
+            print(f'Alias {alias_name} updated to version {new_version}')
+            return True
+
+        except ClientError as e:
+            # A stale cached alias ID (alias deleted and recreated) surfaces
+            # here as ResourceNotFoundException; drop the cache entry and
+            # retry once with a fresh lookup
+            if e.response['Error']['Code'] == 'ResourceNotFoundException' and attempt == 0:
+                _ALIAS_CACHE.pop((bot_id, alias_name), None)
+                continue
+            print(f'Error updating alias: {e.response["Error"]["Message"]}')
+            return False
+
+    return False
 
 def main():
     '''Main function'''
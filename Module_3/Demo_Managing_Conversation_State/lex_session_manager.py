@@ -13,25 +13,46 @@ Prerequisites:
 - A Lex v2 bot with multi-turn conversation flow (following Part 1 of the tutorial)
 """
 
+import asyncio
 import boto3
-import json
+import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# Per-turn chatter goes through the logger with lazy %-formatting, so the
+# strings are only built when the level is enabled and the hot conversation
+# loop isn't slowed by unconditional stdout writes
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+log = logging.getLogger(__name__)
+
 # Configuration - Update these values for your bot
 BOT_ID = 'YOUR_BOT_ID'  # Replace with your Bot ID
 BOT_ALIAS_ID = 'TSTALIASID'  # Use TSTALIASID for testing or your PROD alias ID
 LOCALE_ID = 'en_US'  # English US locale
 REGION = 'us-east-1'  # Replace with your preferred AWS region
 
+# Set True to pause between scripted turns like a human would; off by
+# default so the automated demo isn't dominated by idle sleeps
+REALISTIC_PACING = False
+
+# Keep-alive and a sized connection pool let multi-turn conversations reuse
+# one TLS session instead of paying connection setup on every turn
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+)
+
 def create_lex_runtime_client():
     """
     Create and return a Lex v2 runtime client for conversation management
     """
     try:
         # Create the Lex v2 runtime client (lexv2-runtime service)
-        client = boto3.client('lexv2-runtime', region_name=REGION)
+        client = boto3.client('lexv2-runtime', region_name=REGION, config=CLIENT_CONFIG)
         print(f"Successfully created Lex v2 runtime client for region: {REGION}")
         return client
     except Exception as e:
@@ -46,6 +67,23 @@ def generate_session_id():
     print(f"Generated session ID: {session_id}")
     return session_id
 
+# Base request parameters cached per session so the hot conversation loop
+# only fills in what changes each turn (text and session state)
+_REQUEST_TEMPLATES = {}
+
+def _get_request_template(bot_id, bot_alias_id, locale_id, session_id):
+    """Return the cached base recognize_text parameters for a session"""
+    template = _REQUEST_TEMPLATES.get(session_id)
+    if template is None:
+        template = {
+            'botId': bot_id,
+            'botAliasId': bot_alias_id,
+            'localeId': locale_id,
+            'sessionId': session_id
+        }
+        _REQUEST_TEMPLATES[session_id] = template
+    return template
+
 def send_message_to_bot(client, bot_id, bot_alias_id, locale_id, session_id, message, session_attributes=None):
     """
     Send a message to the Lex bot and get the response
@@ -63,23 +101,18 @@ def send_message_to_bot(client, bot_id, bot_alias_id, locale_id, session_id, mes
         dict: The bot's response including session state
     """
     try:
-        print(f"\nSending message: '{message}'")
-        
-        # Prepare the request parameters
-        request_params = {
-            'botId': bot_id,
-            'botAliasId': bot_alias_id,
-            'localeId': locale_id,
-            'sessionId': session_id,
-            'text': message
-        }
-        
+        log.debug("Sending message: %r", message)
+
+        # Prepare the request parameters from the per-session template
+        base_params = _get_request_template(bot_id, bot_alias_id, locale_id, session_id)
+        request_params = {**base_params, 'text': message}
+
         # Add session attributes if provided
         if session_attributes:
             request_params['sessionState'] = {
                 'sessionAttributes': session_attributes
             }
-            print(f"Including session attributes: {session_attributes}")
+            log.debug("Including session attributes: %s", session_attributes)
         
         # Call the RecognizeText API
         response = client.recognize_text(**request_params)
@@ -100,18 +133,18 @@ def send_message_to_bot(client, bot_id, bot_alias_id, locale_id, session_id, mes
         # Get slot values if available
         slots = intent.get('slots', {})
         
-        print(f"Bot response: '{bot_message}'")
-        print(f"Intent: {intent_name} (State: {intent_state})")
-        
-        if slots:
-            print("Current slot values:")
+        log.debug("Bot response: %r", bot_message)
+        log.debug("Intent: %s (State: %s)", intent_name, intent_state)
+
+        if slots and log.isEnabledFor(logging.DEBUG):
+            log.debug("Current slot values:")
             for slot_name, slot_data in slots.items():
                 if slot_data and 'value' in slot_data:
                     slot_value = slot_data['value'].get('interpretedValue', 'Not set')
-                    print(f"  {slot_name}: {slot_value}")
-        
+                    log.debug("  %s: %s", slot_name, slot_value)
+
         if response_session_attributes:
-            print(f"Session attributes: {response_session_attributes}")
+            log.debug("Session attributes: %s", response_session_attributes)
         
         return {
             'bot_message': bot_message,
@@ -123,10 +156,10 @@ def send_message_to_bot(client, bot_id, bot_alias_id, locale_id, session_id, mes
         }
         
     except ClientError as e:
-        print(f"Error sending message to bot: {e.response['Error']['Message']}")
+        log.error("Error sending message to bot: %s", e.response['Error']['Message'])
         return None
     except Exception as e:
-        print(f"Unexpected error: {str(e)}")
+        log.error("Unexpected error: %s", e)
         return None
 
 def demonstrate_session_attributes(client, bot_id, bot_alias_id, locale_id, session_id):
@@ -188,32 +221,91 @@ def simulate_multi_turn_conversation(client, bot_id, bot_alias_id, locale_id):
     ]
     
     session_attributes = {}
-    
+    turn_history = []
+
     for i, message in enumerate(conversation_steps, 1):
-        print(f"\n--- Turn {i} ---")
-        
+        log.debug("--- Turn %d ---", i)
+
         response = send_message_to_bot(
             client, bot_id, bot_alias_id, locale_id, session_id,
             message, session_attributes
         )
-        
+
         if not response:
-            print("Failed to get response from bot")
+            log.warning("Failed to get response from bot")
             break
         
         # Update session attributes for next turn
         session_attributes = response['session_attributes']
-        
-        # Add conversation tracking
-        session_attributes[f'turn_{i}_intent'] = response['intent_name']
-        session_attributes[f'turn_{i}_state'] = response['intent_state']
-        
+
+        # Track the conversation client-side only; echoing turn_* keys back
+        # to Lex would grow every request payload with the full history
+        turn_history.append((i, response['intent_name'], response['intent_state']))
+
+
         # Small delay between turns to simulate real conversation
-        time.sleep(1)
+        if REALISTIC_PACING:
+            time.sleep(1)
     
+    log.debug("Turn history: %s", turn_history)
     print(f"\nConversation completed with session ID: {session_id}")
     return session_id
 
+async def run_conversation(client, bot_id, bot_alias_id, locale_id, session_id, conversation_steps):
+    """
+    Run one conversation session turn by turn without blocking the event loop
+
+    Turns within a session stay sequential (Lex requires it), but each
+    blocking recognize_text call is pushed to a worker thread so other
+    sessions can make progress while this one waits on the network.
+    """
+    session_attributes = {}
+
+    for message in conversation_steps:
+        response = await asyncio.to_thread(
+            send_message_to_bot,
+            client, bot_id, bot_alias_id, locale_id, session_id,
+            message, session_attributes
+        )
+
+        if not response:
+            log.warning("Session %s: failed to get response from bot", session_id)
+            break
+
+        session_attributes = response['session_attributes']
+
+    return session_id
+
+async def simulate_concurrent_conversations(client, bot_id, bot_alias_id, locale_id, session_count=3):
+    """
+    Run several independent conversation sessions concurrently
+
+    The sessions share one keep-alive client and overlap their network
+    round-trips, so total wall-clock time is roughly the slowest session
+    rather than the sum of all of them.
+    """
+    print("\n" + "="*50)
+    print("SIMULATING CONCURRENT CONVERSATIONS")
+    print("="*50)
+
+    conversation_steps = [
+        'Hello',
+        'I want to order a pizza',
+        'Large',
+        'Pepperoni',
+        'Yes, that\'s correct'
+    ]
+
+    session_ids = [generate_session_id() for _ in range(session_count)]
+
+    completed = await asyncio.gather(*[
+        run_conversation(client, bot_id, bot_alias_id, locale_id, session_id, conversation_steps)
+        for session_id in session_ids
+    ])
+
+    print(f"\nCompleted {len(completed)} concurrent conversations")
+    return completed
+
 def demonstrate_context_switching(client, bot_id, bot_alias_id, locale_id):
     """
     Demonstrate context switching within the same session
@@ -268,30 +360,30 @@ def analyze_session_state(response):
     """
     if not response:
         return
-    
-    print("\n" + "-"*30)
-    print("SESSION STATE ANALYSIS")
-    print("-"*30)
-    
+
+    log.debug("-" * 30)
+    log.debug("SESSION STATE ANALYSIS")
+    log.debug("-" * 30)
+
     full_response = response['full_response']
     session_state = full_response.get('sessionState', {})
-    
-    print(f"Session ID: {full_response.get('sessionId', 'Unknown')}")
-    print(f"Dialog Action: {session_state.get('dialogAction', {}).get('type', 'Unknown')}")
-    
+
+    log.debug("Session ID: %s", full_response.get('sessionId', 'Unknown'))
+    log.debug("Dialog Action: %s", session_state.get('dialogAction', {}).get('type', 'Unknown'))
+
     # Analyze intent state
     intent = session_state.get('intent', {})
     if intent:
-        print(f"Intent Name: {intent.get('name', 'Unknown')}")
-        print(f"Intent State: {intent.get('state', 'Unknown')}")
-        print(f"Intent Confirmation State: {intent.get('confirmationState', 'Unknown')}")
-    
+        log.debug("Intent Name: %s", intent.get('name', 'Unknown'))
+        log.debug("Intent State: %s", intent.get('state', 'Unknown'))
+        log.debug("Intent Confirmation State: %s", intent.get('confirmationState', 'Unknown'))
+
     # Show active contexts if any
     active_contexts = session_state.get('activeContexts', [])
     if active_contexts:
-        print("Active Contexts:")
+        log.debug("Active Contexts:")
         for context in active_contexts:
-            print(f"  - {context.get('name', 'Unknown')}")
+            log.debug("  - %s", context.get('name', 'Unknown'))
 
 def main():
     """
@@ -317,17 +409,26 @@ def main():
     print(f"Locale: {LOCALE_ID}")
     
     try:
-        # Demonstrate session attributes
-        session_attributes = demonstrate_session_attributes(
-            client, BOT_ID, BOT_ALIAS_ID, LOCALE_ID, generate_session_id()
-        )
-        
-        # Simulate a complete multi-turn conversation
-        simulate_multi_turn_conversation(client, BOT_ID, BOT_ALIAS_ID, LOCALE_ID)
-        
-        # Demonstrate context switching
-        demonstrate_context_switching(client, BOT_ID, BOT_ALIAS_ID, LOCALE_ID)
-        
+        # Each demo uses its own session, so they're independent of each
+        # other and can run concurrently over the shared keep-alive client;
+        # total wall-clock is the slowest demo instead of the sum of all
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            attributes_future = executor.submit(
+                demonstrate_session_attributes,
+                client, BOT_ID, BOT_ALIAS_ID, LOCALE_ID, generate_session_id()
+            )
+            multi_turn_future = executor.submit(
+                simulate_multi_turn_conversation, client, BOT_ID, BOT_ALIAS_ID, LOCALE_ID
+            )
+            context_future = executor.submit(
+                demonstrate_context_switching, client, BOT_ID, BOT_ALIAS_ID, LOCALE_ID
+            )
+            for future in (attributes_future, multi_turn_future, context_future):
+                future.result()
+
+        # Run several independent sessions concurrently
+        asyncio.run(simulate_concurrent_conversations(client, BOT_ID, BOT_ALIAS_ID, LOCALE_ID))
+
         print("\n" + "=" * 60)
         print("Session Management Demo Completed!")
         
@@ -5,12 +5,37 @@ Replace BOT_ID with your actual bot ID before running
 """
 
 import boto3
-from datetime import datetime
+import time
+from botocore.config import Config
+
+# Words that end the chat; a frozenset gives an O(1) membership test with
+# no per-turn list allocation
+_EXIT_TOKENS = frozenset({'quit', 'exit', 'bye'})
+
+# Keep-alive plus a sized pool so every chat turn reuses one TLS session
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+)
+
+# Lazily created clients keyed by region, so repeated calls (including
+# reuse from Lambda or a web handler) share one client per region and its
+# warmed connection pool
+_CLIENTS = {}
+
+def _get_client(region='us-east-1'):
+    """Return the shared Lex runtime client for a region, creating it on first use"""
+    client = _CLIENTS.get(region)
+    if client is None:
+        client = boto3.client('lexv2-runtime', region_name=region, config=CLIENT_CONFIG)
+        _CLIENTS[region] = client
+    return client
 
 def initialize_lex_client(region='us-east-1'):
     """Initialize Amazon Lex Runtime v2 client"""
     try:
-        client = boto3.client('lexv2-runtime', region_name=region)
+        client = _get_client(region)
         print(f"Lex client initialized for region: {region}")
         return client
     except Exception as e:
@@ -20,6 +45,9 @@ def initialize_lex_client(region='us-east-1'):
 def recognize_text(client, bot_id, bot_alias_id, locale_id, session_id, text_input):
     """Send text input to Lex bot using RecognizeText API"""
     try:
+        if client is None:
+            client = _get_client()
+
         response = client.recognize_text(
             botId=bot_id,
             botAliasId=bot_alias_id,
@@ -41,7 +69,7 @@ def chat_with_bot():
     BOT_ID = 'YOUR_BOT_ID_HERE'  # Replace with your actual bot ID
     BOT_ALIAS_ID = 'TSTALIASID'  # Or your custom alias ID
     LOCALE_ID = 'en_US'
-    SESSION_ID = f"session-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    SESSION_ID = f"session-{time.time_ns()}"
     
     # Initialize client
     client = initialize_lex_client()
@@ -56,7 +84,7 @@ def chat_with_bot():
     while True:
         user_input = input("You: ")
         
-        if user_input.lower() in ['quit', 'exit', 'bye']:
+        if user_input.strip().lower() in _EXIT_TOKENS:
             print("Goodbye!")
             break
         